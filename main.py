@@ -1,15 +1,25 @@
-from flask import Flask, jsonify, request, abort
+from flask import Flask, Response, request, abort
 from flask_cors import CORS  # Import CORS
 import os
-import json
+import atexit
 import logging
-from dataclasses import dataclass, field, asdict
-from datetime import date, datetime
+import sqlite3
+import threading
+import orjson
+import msgpack
+import numpy as np
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; depreciation falls back to plain NumPy
+    njit = None
+from dataclasses import dataclass, field
+from datetime import date
 from decimal import Decimal
-from typing import Optional, List, Dict, Any, Callable, Union
+from typing import Optional, List, Dict, Any, Callable, Iterable, Iterator, Tuple, Type, TypeVar, Generic
 from uuid import UUID, uuid4
 from enum import Enum
 from functools import wraps
+from collections import defaultdict
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -32,6 +42,9 @@ class FileHandlerError(ERPError):
 class InvalidDataError(ERPError):
     """Raised when data is invalid"""
 
+class StorageError(ERPError):
+    """Raised when the SQLite backing store fails"""
+
 # Enums
 class AssetStatus(Enum):
     ACTIVE = "Active"
@@ -60,6 +73,34 @@ class InventoryStatus(Enum):
     OUT_OF_STOCK = "Out of Stock"
     RESERVED = "Reserved"
 
+# Enum member -> value lookups used by to_dict, cheaper than Enum.value
+_ASSET_STATUS_VALUES = {s: s.value for s in AssetStatus}
+_DEPRECIATION_METHOD_VALUES = {m: m.value for m in DepreciationMethod}
+_MAINTENANCE_TYPE_VALUES = {t: t.value for t in MaintenanceType}
+_MAINTENANCE_STATUS_VALUES = {s: s.value for s in MaintenanceStatus}
+_INVENTORY_STATUS_VALUES = {s: s.value for s in InventoryStatus}
+
+# Responses
+def json_default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def json_response(obj: Any, status: int = 200) -> Response:
+    """Encode obj straight to a JSON Response with orjson, skipping jsonify"""
+    return Response(orjson.dumps(obj, default=json_default), status=status, mimetype='application/json')
+
+def encode_input_json(obj: Any) -> bytes:
+    """Encode client-supplied data, rejecting anything orjson cannot write back"""
+    # orjson.loads accepts far deeper nesting than orjson.dumps will emit, so
+    # such data must be refused before it is stored and breaks every list read
+    try:
+        return orjson.dumps(obj, default=json_default)
+    except orjson.JSONEncodeError as e:
+        raise InvalidDataError(f"Data cannot be encoded as JSON: {e}") from e
+
 # Decorators
 def error_handler(func):
     @wraps(func)
@@ -68,10 +109,10 @@ def error_handler(func):
             return func(*args, **kwargs)
         except ERPError as e:
             logger.error(f"ERPError in {func.__name__}: {str(e)}")
-            return jsonify({"error": str(e)}), 400
+            return json_response({"error": str(e)}, 400)
         except Exception as e:
             logger.error(f"Unexpected error in {func.__name__}: {str(e)}")
-            return jsonify({"error": "An unexpected error occurred."}), 500
+            return json_response({"error": "An unexpected error occurred."}, 500)
     return wrapper
 
 def validate_input(validation_func: Callable):
@@ -84,8 +125,19 @@ def validate_input(validation_func: Callable):
         return wrapper
     return decorator
 
+# Depreciation constants: a year is 365.25 days, i.e. 1461 days per 4 years
+DAYS_PER_YEAR = 365.25
+DAYS_PER_FOUR_YEARS = 1461
+
+def round_div(numerator: int, denominator: int) -> int:
+    """Integer numerator / denominator rounded half to even, like np.rint"""
+    quotient, remainder = divmod(numerator, denominator)
+    if 2 * remainder > denominator or (2 * remainder == denominator and quotient % 2):
+        quotient += 1
+    return quotient
+
 # Models
-@dataclass
+@dataclass(slots=True)
 class Asset:
     name: str
     purchase_date: date
@@ -101,40 +153,83 @@ class Asset:
     serial_number: Optional[str] = None
     description: Optional[str] = None
     maintenance_records: List['Maintenance'] = field(default_factory=list)
+    _purchase_price_cents: int = field(init=False, repr=False, compare=False)
+    _salvage_value_cents: int = field(init=False, repr=False, compare=False)
+    _decline_factor: float = field(init=False, repr=False, compare=False)
+    _purchase_ord: int = field(init=False, repr=False, compare=False)
+    _sum_of_years: int = field(init=False, repr=False, compare=False)
+    _id_str: str = field(init=False, repr=False, compare=False)
+    _purchase_date_iso: str = field(init=False, repr=False, compare=False)
+    _purchase_price_str: str = field(init=False, repr=False, compare=False)
+    _salvage_value_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._refresh_cached()
+
+    def _refresh_cached(self) -> None:
+        """Recompute the depreciation inputs and serialized forms of fields that only change on update"""
+        # Integer-cent copies of the prices used by depreciate()
+        self._purchase_price_cents = round(self.purchase_price * 100)
+        self._salvage_value_cents = round(self.salvage_value * 100)
+        # Per-asset terms of the declining-balance and sum-of-years-digits formulas
+        life = self.useful_life_years
+        self._decline_factor = max(1 - 2 / life, 0.0) if life > 0 else 0.0
+        self._sum_of_years = life * (life + 1) // 2
+        self._purchase_ord = self.purchase_date.toordinal()
+        self._id_str = str(self.id)
+        self._purchase_date_iso = self.purchase_date.isoformat()
+        self._purchase_price_str = str(self.purchase_price)
+        self._salvage_value_str = str(self.salvage_value)
 
     def depreciate(self, as_of_date: date) -> None:
         if self.status != AssetStatus.ACTIVE:
             return
 
-        years_passed = Decimal((as_of_date - self.purchase_date).days) / Decimal(365.25)
+        elapsed_days = max(as_of_date.toordinal() - self._purchase_ord, 0)
+        years_passed = elapsed_days / DAYS_PER_YEAR
         if years_passed > self.useful_life_years:
             self.current_value = self.salvage_value
             return
 
+        life = self.useful_life_years
+        purchase_cents = self._purchase_price_cents
+        salvage_cents = self._salvage_value_cents
         if self.depreciation_method == DepreciationMethod.STRAIGHT_LINE:
-            annual_depreciation = (self.purchase_price - self.salvage_value) / Decimal(self.useful_life_years)
-            self.current_value = max(self.purchase_price - (annual_depreciation * years_passed), self.salvage_value)
+            # Scaling days by 4 keeps the elapsed fraction exact in integers
+            denominator = life * DAYS_PER_FOUR_YEARS
+            value_cents = round_div(
+                purchase_cents * denominator - (purchase_cents - salvage_cents) * elapsed_days * 4, denominator
+            )
         elif self.depreciation_method == DepreciationMethod.DECLINING_BALANCE:
-            rate = Decimal(2) / Decimal(self.useful_life_years)
-            self.current_value = max(self.purchase_price * (Decimal(1) - rate) ** years_passed, self.salvage_value)
+            value_cents = round(purchase_cents * self._decline_factor ** years_passed)
         elif self.depreciation_method == DepreciationMethod.SUM_OF_YEARS_DIGITS:
-            sum_of_years = sum(range(1, self.useful_life_years + 1))
-            total_depreciation = sum(
-                (self.useful_life_years - year) / Decimal(sum_of_years) * (self.purchase_price - self.salvage_value)
-                for year in range(int(years_passed))
+            # Closed form of sum(L - k for k in range(y))
+            full_years = int(years_passed)
+            digits_used = life * full_years - full_years * (full_years - 1) // 2
+            value_cents = round_div(
+                purchase_cents * self._sum_of_years - (purchase_cents - salvage_cents) * digits_used, self._sum_of_years
             )
-            self.current_value = max(self.purchase_price - total_depreciation, self.salvage_value)
+        else:
+            return
+        self.current_value = Decimal(max(value_cents, salvage_cents)).scaleb(-2)
 
     def to_dict(self) -> dict:
-        asset_dict = asdict(self)
-        asset_dict['id'] = str(self.id)
-        asset_dict['purchase_date'] = self.purchase_date.isoformat()
-        asset_dict['purchase_price'] = str(self.purchase_price)
-        asset_dict['current_value'] = str(self.current_value)
-        asset_dict['salvage_value'] = str(self.salvage_value)
-        asset_dict['status'] = self.status.value
-        asset_dict['depreciation_method'] = self.depreciation_method.value
-        return asset_dict
+        return {
+            'name': self.name,
+            'purchase_date': self._purchase_date_iso,
+            'purchase_price': self._purchase_price_str,
+            'current_value': str(self.current_value),
+            'location': self.location,
+            'category': self.category,
+            'useful_life_years': self.useful_life_years,
+            'id': self._id_str,
+            'status': _ASSET_STATUS_VALUES[self.status],
+            'depreciation_method': _DEPRECIATION_METHOD_VALUES[self.depreciation_method],
+            'salvage_value': self._salvage_value_str,
+            'serial_number': self.serial_number,
+            'description': self.description,
+            'maintenance_records': [m.to_dict() for m in self.maintenance_records],
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Asset':
@@ -145,9 +240,10 @@ class Asset:
         data['salvage_value'] = Decimal(data['salvage_value'])
         data['status'] = AssetStatus(data.get('status', 'ACTIVE'))
         data['depreciation_method'] = DepreciationMethod(data['depreciation_method'])
+        data['maintenance_records'] = [Maintenance.from_dict(m) for m in data.get('maintenance_records', [])]
         return cls(**data)
 
-@dataclass
+@dataclass(slots=True)
 class Maintenance:
     asset_id: UUID
     date: date
@@ -158,16 +254,33 @@ class Maintenance:
     id: UUID = field(default_factory=uuid4)
     status: MaintenanceStatus = MaintenanceStatus.SCHEDULED
     notes: Optional[str] = None
+    _id_str: str = field(init=False, repr=False, compare=False)
+    _asset_id_str: str = field(init=False, repr=False, compare=False)
+    _date_iso: str = field(init=False, repr=False, compare=False)
+    _cost_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._refresh_cached()
+
+    def _refresh_cached(self) -> None:
+        """Recompute the serialized forms of fields that only change on update"""
+        self._id_str = str(self.id)
+        self._asset_id_str = str(self.asset_id)
+        self._date_iso = self.date.isoformat()
+        self._cost_str = str(self.cost)
 
     def to_dict(self) -> dict:
-        maintenance_dict = asdict(self)
-        maintenance_dict['id'] = str(self.id)
-        maintenance_dict['asset_id'] = str(self.asset_id)
-        maintenance_dict['date'] = self.date.isoformat()
-        maintenance_dict['cost'] = str(self.cost)
-        maintenance_dict['maintenance_type'] = self.maintenance_type.value
-        maintenance_dict['status'] = self.status.value
-        return maintenance_dict
+        return {
+            'asset_id': self._asset_id_str,
+            'date': self._date_iso,
+            'description': self.description,
+            'cost': self._cost_str,
+            'performed_by': self.performed_by,
+            'maintenance_type': _MAINTENANCE_TYPE_VALUES[self.maintenance_type],
+            'id': self._id_str,
+            'status': _MAINTENANCE_STATUS_VALUES[self.status],
+            'notes': self.notes,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Maintenance':
@@ -179,20 +292,32 @@ class Maintenance:
         data['status'] = MaintenanceStatus(data.get('status', 'SCHEDULED'))
         return cls(**data)
 
-@dataclass
+@dataclass(slots=True)
 class InventoryItem:
     name: str
     quantity: int
     cost_per_item: Decimal
     status: InventoryStatus = InventoryStatus.IN_STOCK
     id: UUID = field(default_factory=uuid4)
+    _id_str: str = field(init=False, repr=False, compare=False)
+    _cost_per_item_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._refresh_cached()
+
+    def _refresh_cached(self) -> None:
+        """Recompute the serialized forms of fields that only change on update"""
+        self._id_str = str(self.id)
+        self._cost_per_item_str = str(self.cost_per_item)
 
     def to_dict(self) -> dict:
-        item_dict = asdict(self)
-        item_dict['id'] = str(self.id)
-        item_dict['cost_per_item'] = str(self.cost_per_item)
-        item_dict['status'] = self.status.value
-        return item_dict
+        return {
+            'name': self.name,
+            'quantity': self.quantity,
+            'cost_per_item': self._cost_per_item_str,
+            'status': _INVENTORY_STATUS_VALUES[self.status],
+            'id': self._id_str,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> 'InventoryItem':
@@ -203,6 +328,8 @@ class InventoryItem:
 
 # File Handler
 class FileHandler:
+    """Reader for the JSON state files used before the SQLite store"""
+
     def __init__(self, filename: str):
         self.filename = filename
 
@@ -210,50 +337,309 @@ class FileHandler:
     def load(self) -> Dict[str, Any]:
         if not os.path.exists(self.filename):
             return {}
-        with open(self.filename, 'r') as file:
-            return json.load(file)
+        with open(self.filename, 'rb') as file:
+            return orjson.loads(file.read())
+
+# SQLite Handler
+class SQLiteHandler:
+    """Keyed record store backed by one SQLite table.
+
+    Each record is kept as a MessagePack blob under its id, so a mutation
+    touches only its own row instead of rewriting the whole set. Writes are
+    queued and committed by a background thread, one transaction per batch,
+    so callers never wait on disk; later changes to a key replace earlier
+    ones still in the queue.
+    """
+
+    def __init__(self, db_path: str, table: str):
+        self.db_path = db_path
+        self.table = table
+        self._lock = threading.Lock()
+        try:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            with self._conn:
+                self._conn.execute(
+                    f'CREATE TABLE IF NOT EXISTS {table} (id TEXT PRIMARY KEY, payload BLOB NOT NULL)'
+                )
+        except sqlite3.Error as e:
+            raise StorageError(f"Could not open table {table} in {db_path}: {e}") from e
+        # Encoded pending writes by id; None marks a delete
+        self._pending: Dict[str, Optional[bytes]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._dirty = threading.Event()
+        threading.Thread(target=self._write_loop, name=f'sqlite-writer-{table}', daemon=True).start()
+        atexit.register(self.flush)
+
+    def load(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        self.flush()
+        with self._lock:
+            try:
+                rows = self._conn.execute(f'SELECT id, payload FROM {self.table}').fetchall()
+            except sqlite3.Error as e:
+                raise StorageError(f"Could not read table {self.table}: {e}") from e
+        for key, payload in rows:
+            yield key, msgpack.unpackb(payload, raw=False)
+
+    def upsert(self, key: str, record: Dict[str, Any]) -> None:
+        self.upsert_many(((key, record),))
+
+    def upsert_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        # Encode on the caller's thread so a bad record fails here, before
+        # anything is queued, rather than jamming the background writer
+        encoded = []
+        for key, record in items:
+            try:
+                encoded.append((key, self._encode(record)))
+            except (TypeError, ValueError, OverflowError) as e:
+                raise InvalidDataError(f"Cannot store record {key} in {self.table}: {e}") from e
+        with self._pending_lock:
+            self._pending.update(encoded)
+        self._dirty.set()
+
+    def delete(self, key: str) -> None:
+        with self._pending_lock:
+            self._pending[key] = None
+        self._dirty.set()
+
+    def flush(self) -> None:
+        """Commit every queued write now, in a single transaction"""
+        # Held across take-and-write so batches reach the table in queue order
+        with self._flush_lock:
+            with self._pending_lock:
+                batch, self._pending = self._pending, {}
+                self._dirty.clear()
+            if not batch:
+                return
+            upserts = [(key, payload) for key, payload in batch.items() if payload is not None]
+            deletes = [(key,) for key, payload in batch.items() if payload is None]
+            try:
+                with self._lock, self._conn:
+                    self._conn.executemany(
+                        f'INSERT OR REPLACE INTO {self.table} (id, payload) VALUES (?, ?)', upserts
+                    )
+                    self._conn.executemany(f'DELETE FROM {self.table} WHERE id = ?', deletes)
+            except sqlite3.Error as e:
+                # Put the batch back behind anything queued meanwhile and retry later
+                with self._pending_lock:
+                    for key, payload in batch.items():
+                        self._pending.setdefault(key, payload)
+                raise StorageError(f"Could not write to table {self.table}: {e}") from e
+
+    def _write_loop(self) -> None:
+        while True:
+            self._dirty.wait()
+            try:
+                self.flush()
+            except Exception as e:
+                # Never let the writer thread die; the batch stays queued for the next pass
+                logger.error(f"Background write failed, retrying on next change: {e}")
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self._conn.execute(f'SELECT 1 FROM {self.table} LIMIT 1').fetchone() is None
+
+    def import_legacy(self, file_handler: 'FileHandler') -> None:
+        """One-time migration of a JSON state file into an empty table"""
+        if not self.is_empty() or not os.path.exists(file_handler.filename):
+            return
+        data = file_handler.load()
+        self.upsert_many(data.items())
+        logger.info(f"Imported {len(data)} records from {file_handler.filename} into {self.table}")
 
-    @error_handler
-    def save(self, data: Dict[str, Any]) -> None:
-        with open(self.filename, 'w') as file:
-            json.dump(data, file, indent=2, default=self._json_serializer)
+    @staticmethod
+    def _encode(record: Dict[str, Any]) -> bytes:
+        return msgpack.packb(record, default=SQLiteHandler._msgpack_default, use_bin_type=True)
 
     @staticmethod
-    def _json_serializer(obj: Any) -> Union[str, Dict[str, Any]]:
-        if isinstance(obj, (date, datetime)):
-            return obj.isoformat()
-        if isinstance(obj, Decimal):
-            return str(obj)
-        if isinstance(obj, UUID):
-            return str(obj)
+    def _msgpack_default(obj: Any) -> Any:
+        if isinstance(obj, (date, UUID, Decimal)):
+            return obj.isoformat() if isinstance(obj, date) else str(obj)
         if isinstance(obj, Enum):
             return obj.value
-        return obj.__dict__
+        raise TypeError(f"Cannot serialize object of type {type(obj).__name__}")
+
+# Columnar asset view for batch depreciation
+DEPRECIATION_METHOD_CODES = {
+    DepreciationMethod.STRAIGHT_LINE: 0,
+    DepreciationMethod.DECLINING_BALANCE: 1,
+    DepreciationMethod.SUM_OF_YEARS_DIGITS: 2,
+}
+
+if njit is not None:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _depreciate_kernel(pp, sv, life, method, purchase_ord, as_of_ord, out):
+        for i in prange(pp.shape[0]):
+            days = float(max(as_of_ord - purchase_ord[i], 0))
+            years = days / DAYS_PER_YEAR
+            if life[i] <= 0.0 or years > life[i]:
+                value = sv[i]
+            elif method[i] == 0:
+                denominator = life[i] * DAYS_PER_FOUR_YEARS
+                value = (pp[i] * denominator - (pp[i] - sv[i]) * days * 4.0) / denominator
+            elif method[i] == 1:
+                value = pp[i] * max(1.0 - 2.0 / life[i], 0.0) ** years
+            elif method[i] == 2:
+                full_years = np.floor(years)
+                sum_of_years = life[i] * (life[i] + 1.0) / 2.0
+                digits_used = life[i] * full_years - full_years * (full_years - 1.0) / 2.0
+                value = (pp[i] * sum_of_years - (pp[i] - sv[i]) * digits_used) / sum_of_years
+            else:
+                value = pp[i]
+            out[i] = np.int64(np.rint(max(value, sv[i])))
+
+@dataclass
+class AssetColumns:
+    """Structure-of-arrays snapshot of the depreciation inputs of a set of assets"""
+    assets: List[Asset]
+    purchase_cents: np.ndarray
+    salvage_cents: np.ndarray
+    useful_life_years: np.ndarray
+    purchase_ordinal: np.ndarray
+    method_code: np.ndarray
+    active: np.ndarray
+    current_value_cents: np.ndarray
+
+    @classmethod
+    def from_assets(cls, assets: List[Asset]) -> 'AssetColumns':
+        n = len(assets)
+        return cls(
+            assets=assets,
+            purchase_cents=np.fromiter((a._purchase_price_cents for a in assets), np.float64, n),
+            salvage_cents=np.fromiter((a._salvage_value_cents for a in assets), np.float64, n),
+            useful_life_years=np.fromiter((a.useful_life_years for a in assets), np.float64, n),
+            purchase_ordinal=np.fromiter((a._purchase_ord for a in assets), np.int64, n),
+            method_code=np.fromiter((DEPRECIATION_METHOD_CODES[a.depreciation_method] for a in assets), np.int8, n),
+            active=np.fromiter((a.status == AssetStatus.ACTIVE for a in assets), np.bool_, n),
+            current_value_cents=np.fromiter((round(a.current_value * 100) for a in assets), np.int64, n),
+        )
+
+    def depreciated_cents(self, as_of_date: date) -> np.ndarray:
+        """Vectorized equivalent of Asset.depreciate, rounded to whole cents"""
+        # Prices are whole cents held in float64, so the straight-line and
+        # sum-of-years numerators below are exact integers and an exact
+        # half-cent quotient rounds half to even, as round_div does
+        pp, sv, life = self.purchase_cents, self.salvage_cents, self.useful_life_years
+        if njit is not None:
+            out = np.empty(pp.shape[0], dtype=np.int64)
+            _depreciate_kernel(pp, sv, life, self.method_code, self.purchase_ordinal, as_of_date.toordinal(), out)
+            return out
+        days = np.maximum(as_of_date.toordinal() - self.purchase_ordinal, 0).astype(np.float64)
+        years = days / DAYS_PER_YEAR
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            denominator = life * DAYS_PER_FOUR_YEARS
+            straight_line = (pp * denominator - (pp - sv) * days * 4.0) / denominator
+            declining = pp * np.maximum(1.0 - 2.0 / life, 0.0) ** years
+            full_years = np.floor(years)
+            sum_of_years = life * (life + 1.0) / 2.0
+            digits_used = life * full_years - full_years * (full_years - 1.0) / 2.0
+            sum_of_digits = (pp * sum_of_years - (pp - sv) * digits_used) / sum_of_years
+            value = np.select(
+                [self.method_code == 0, self.method_code == 1, self.method_code == 2],
+                [straight_line, declining, sum_of_digits],
+                default=pp,
+            )
+            value = np.where((life <= 0) | (years > life), sv, np.maximum(value, sv))
+        return np.rint(value).astype(np.int64)
+
+# Stores
+T = TypeVar('T', Asset, Maintenance, InventoryItem)
+
+class DictStore(Generic[T]):
+    """Model objects keyed by id, mirrored row by row into a SQLiteHandler.
+
+    Each mutation bumps ``generation`` so owners can tell when data derived
+    from the items (such as the cached JSON list) has gone stale.
+    """
+
+    def __init__(self, handler: SQLiteHandler, model: Type[T]):
+        self.handler = handler
+        self.model = model
+        self.items: Dict[UUID, T] = {}
+        self.generation = 0
+        # (generation, body) pair, so a body built from older data never passes as current
+        self._cached_json: Optional[Tuple[int, bytes]] = None
+        self.load()
+
+    def load(self) -> None:
+        items = (self.model.from_dict(record) for _, record in self.handler.load())
+        self.items = {item.id: item for item in items}
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        self.generation += 1
+
+    def get(self, item_id: UUID) -> Optional[T]:
+        return self.items.get(item_id)
+
+    def __contains__(self, item_id: UUID) -> bool:
+        return item_id in self.items
+
+    def put(self, item: T) -> None:
+        self.put_many((item,))
+
+    def put_many(self, items: Iterable[T]) -> None:
+        items = list(items)
+        # Save first: a record the handler rejects never reaches the store
+        self.save(items)
+        for item in items:
+            self.items[item.id] = item
+        self.invalidate()
+
+    def remove(self, item_id: UUID) -> T:
+        item = self.items.pop(item_id)
+        self.invalidate()
+        self.handler.delete(str(item_id))
+        return item
+
+    def save(self, items: Iterable[T]) -> None:
+        """Persist items already held in the store"""
+        # to_dict() carries the pre-stringified id, so it doubles as the row key
+        records = (item.to_dict() for item in items)
+        self.handler.upsert_many((record['id'], record) for record in records)
+
+    def to_json(self) -> bytes:
+        """Serialized item list, reused until the next mutation"""
+        cached = self._cached_json
+        if cached is not None and cached[0] == self.generation:
+            return cached[1]
+        # Read the generation before the items: a mutation landing mid-build
+        # leaves this tag behind the counter, so the next call rebuilds
+        generation = self.generation
+        body = orjson.dumps([item.to_dict() for item in list(self.items.values())])
+        self._cached_json = (generation, body)
+        return body
 
 # Services
 class AssetService:
-    def __init__(self, file_handler: FileHandler):
-        self.file_handler = file_handler
-        self.assets: Dict[UUID, Asset] = {}
-        self._load_assets()
+    def __init__(self, handler: SQLiteHandler):
+        self.store: DictStore[Asset] = DictStore(handler, Asset)
+        self._columns: Optional[AssetColumns] = None
+        self._columns_generation = -1
 
-    def _load_assets(self):
-        data = self.file_handler.load()
-        self.assets = {UUID(k): Asset.from_dict(v) for k, v in data.items()}
+    @property
+    def assets(self) -> Dict[UUID, Asset]:
+        return self.store.items
 
-    def _save_assets(self):
-        data = {str(k): v.to_dict() for k, v in self.assets.items()}
-        self.file_handler.save(data)
+    def reload(self) -> None:
+        """Re-read the backing store, discarding the in-memory state"""
+        self.store.load()
 
     @error_handler
     @validate_input(lambda self, asset: isinstance(asset, Asset))
     def add_asset(self, asset: Asset) -> None:
-        self.assets[asset.id] = asset
-        self._save_assets()
+        self.store.put(asset)
+
+    @error_handler
+    @validate_input(lambda self, assets: all(isinstance(asset, Asset) for asset in assets))
+    def add_assets(self, assets: List[Asset]) -> None:
+        self.store.put_many(assets)
 
     @error_handler
     def get_asset(self, asset_id: UUID) -> Asset:
-        asset = self.assets.get(asset_id)
+        asset = self.store.get(asset_id)
         if not asset:
             raise AssetManagementError(f"Asset with id {asset_id} not found")
         return asset
@@ -261,50 +647,100 @@ class AssetService:
     @error_handler
     @validate_input(lambda self, asset: isinstance(asset, Asset))
     def update_asset(self, asset: Asset) -> None:
-        if asset.id not in self.assets:
+        if asset.id not in self.store:
             raise AssetManagementError(f"Asset with id {asset.id} not found")
-        self.assets[asset.id] = asset
-        self._save_assets()
+        # The caller may have edited this same instance in place
+        asset._refresh_cached()
+        self.store.put(asset)
 
     @error_handler
     def delete_asset(self, asset_id: UUID) -> None:
-        if asset_id not in self.assets:
+        if asset_id not in self.store:
             raise AssetManagementError(f"Asset with id {asset_id} not found")
-        del self.assets[asset_id]
-        self._save_assets()
+        self.store.remove(asset_id)
 
     def get_all_assets(self) -> List[Asset]:
-        return list(self.assets.values())
+        return list(self.store.items.values())
+
+    def get_all_assets_json(self) -> bytes:
+        return self.store.to_json()
 
     @error_handler
     def depreciate_all_assets(self, as_of_date: date) -> None:
-        for asset in self.assets.values():
-            asset.depreciate(as_of_date)
-        self._save_assets()
+        # The column snapshot is rebuilt lazily after any add/update/delete
+        if self._columns is None or self._columns_generation != self.store.generation:
+            self._columns_generation = self.store.generation
+            self._columns = AssetColumns.from_assets(self.get_all_assets())
+        columns = self._columns
+        new_cents = columns.depreciated_cents(as_of_date)
+        changed = np.flatnonzero(columns.active & (new_cents != columns.current_value_cents))
+        columns.current_value_cents[changed] = new_cents[changed]
+
+        updated = []
+        for i in changed.tolist():
+            asset = columns.assets[i]
+            asset.current_value = Decimal(int(new_cents[i])).scaleb(-2)
+            updated.append(asset)
+        if updated:
+            generation = self.store.generation
+            self.store.invalidate()
+            self.store.save(updated)
+            # The snapshot was patched in place above, so it stays current unless
+            # another mutation also bumped the generation since it was built
+            if generation == self._columns_generation and self.store.generation == generation + 1:
+                self._columns_generation = self.store.generation
 
 class MaintenanceService:
-    def __init__(self, file_handler: FileHandler):
-        self.file_handler = file_handler
-        self.maintenances: Dict[UUID, Maintenance] = {}
-        self._load_maintenances()
-
-    def _load_maintenances(self):
-        data = self.file_handler.load()
-        self.maintenances = {UUID(k): Maintenance.from_dict(v) for k, v in data.items()}
+    def __init__(self, handler: SQLiteHandler):
+        self.store: DictStore[Maintenance] = DictStore(handler, Maintenance)
+        self._by_asset: Dict[UUID, List[Maintenance]] = defaultdict(list)
+        # asset_id each record is filed under, which may predate an in-place edit
+        self._indexed_asset: Dict[UUID, UUID] = {}
+        self._build_index()
+
+    @property
+    def maintenances(self) -> Dict[UUID, Maintenance]:
+        return self.store.items
+
+    def _build_index(self) -> None:
+        self._by_asset = defaultdict(list)
+        self._indexed_asset = {}
+        for maintenance in self.store.items.values():
+            self._index(maintenance)
+
+    def _index(self, maintenance: Maintenance) -> None:
+        self._by_asset[maintenance.asset_id].append(maintenance)
+        self._indexed_asset[maintenance.id] = maintenance.asset_id
+
+    def _put_indexed(self, maintenance: Maintenance) -> None:
+        """Store maintenance by id, keeping the per-asset index in step"""
+        self.store.put(maintenance)
+        self._unindex(maintenance.id)
+        self._index(maintenance)
+
+    def _unindex(self, maintenance_id: UUID) -> None:
+        asset_id = self._indexed_asset.pop(maintenance_id, None)
+        if asset_id is None:
+            return
+        records = [m for m in self._by_asset[asset_id] if m.id != maintenance_id]
+        if records:
+            self._by_asset[asset_id] = records
+        else:
+            del self._by_asset[asset_id]
 
-    def _save_maintenances(self):
-        data = {str(k): v.to_dict() for k, v in self.maintenances.items()}
-        self.file_handler.save(data)
+    def reload(self) -> None:
+        """Re-read the backing store, discarding the in-memory state"""
+        self.store.load()
+        self._build_index()
 
     @error_handler
     @validate_input(lambda self, maintenance: isinstance(maintenance, Maintenance))
     def add_maintenance(self, maintenance: Maintenance) -> None:
-        self.maintenances[maintenance.id] = maintenance
-        self._save_maintenances()
+        self._put_indexed(maintenance)
 
     @error_handler
     def get_maintenance(self, maintenance_id: UUID) -> Maintenance:
-        maintenance = self.maintenances.get(maintenance_id)
+        maintenance = self.store.get(maintenance_id)
         if not maintenance:
             raise AssetManagementError(f"Maintenance with id {maintenance_id} not found")
         return maintenance
@@ -312,140 +748,195 @@ class MaintenanceService:
     @error_handler
     @validate_input(lambda self, maintenance: isinstance(maintenance, Maintenance))
     def update_maintenance(self, maintenance: Maintenance) -> None:
-        if maintenance.id not in self.maintenances:
+        if maintenance.id not in self.store:
             raise AssetManagementError(f"Maintenance with id {maintenance.id} not found")
-        self.maintenances[maintenance.id] = maintenance
-        self._save_maintenances()
+        # The caller may have edited this same instance in place
+        maintenance._refresh_cached()
+        self._put_indexed(maintenance)
 
     @error_handler
     def delete_maintenance(self, maintenance_id: UUID) -> None:
-        if maintenance_id not in self.maintenances:
+        if maintenance_id not in self.store:
             raise AssetManagementError(f"Maintenance with id {maintenance_id} not found")
-        del self.maintenances[maintenance_id]
-        self._save_maintenances()
+        self.store.remove(maintenance_id)
+        self._unindex(maintenance_id)
 
     def get_asset_maintenances(self, asset_id: UUID) -> List[Maintenance]:
-        return [m for m in self.maintenances.values() if m.asset_id == asset_id]
+        return list(self._by_asset.get(asset_id, ()))
 
 class InventoryService:
-    def __init__(self, file_handler: FileHandler):
-        self.file_handler = file_handler
-        self.inventory: Dict[UUID, InventoryItem] = {}
-        self._load_inventory()
+    def __init__(self, handler: SQLiteHandler):
+        self.store: DictStore[InventoryItem] = DictStore(handler, InventoryItem)
 
-    def _load_inventory(self):
-        data = self.file_handler.load()
-        self.inventory = {UUID(k): InventoryItem.from_dict(v) for k, v in data.items()}
+    @property
+    def inventory(self) -> Dict[UUID, InventoryItem]:
+        return self.store.items
 
-    def _save_inventory(self):
-        data = {str(k): v.to_dict() for k, v in self.inventory.items()}
-        self.file_handler.save(data)
+    def reload(self) -> None:
+        """Re-read the backing store, discarding the in-memory state"""
+        self.store.load()
 
     @error_handler
     @validate_input(lambda self, item: isinstance(item, InventoryItem))
     def add_inventory_item(self, item: InventoryItem) -> None:
-        self.inventory[item.id] = item
-        self._save_inventory()
+        self.store.put(item)
+
+    @error_handler
+    @validate_input(lambda self, items: all(isinstance(item, InventoryItem) for item in items))
+    def add_inventory_items(self, items: List[InventoryItem]) -> None:
+        self.store.put_many(items)
 
     @error_handler
     def get_inventory_item(self, item_id: UUID) -> InventoryItem:
-        item = self.inventory.get(item_id)
+        item = self.store.get(item_id)
         if not item:
             raise AssetManagementError(f"Inventory item with id {item_id} not found")
         return item
 
     @error_handler
     def update_inventory_item(self, item: InventoryItem) -> None:
-        if item.id not in self.inventory:
+        if item.id not in self.store:
             raise AssetManagementError(f"Inventory item with id {item.id} not found")
-        self.inventory[item.id] = item
-        self._save_inventory()
+        # The caller may have edited this same instance in place
+        item._refresh_cached()
+        self.store.put(item)
 
     @error_handler
     def delete_inventory_item(self, item_id: UUID) -> None:
-        if item_id not in self.inventory:
+        if item_id not in self.store:
             raise AssetManagementError(f"Inventory item with id {item_id} not found")
-        del self.inventory[item_id]
-        self._save_inventory()
+        self.store.remove(item_id)
 
     def get_all_inventory_items(self) -> List[InventoryItem]:
-        return list(self.inventory.values())
+        return list(self.store.items.values())
+
+    def get_all_inventory_items_json(self) -> bytes:
+        return self.store.to_json()
+
+# Shared service instances, loaded once at import time
+DB_PATH = 'erp.db'
+
+def open_store(table: str, legacy_filename: str) -> SQLiteHandler:
+    store = SQLiteHandler(DB_PATH, table)
+    store.import_legacy(FileHandler(legacy_filename))
+    return store
+
+asset_service = AssetService(open_store('assets', 'assets.json'))
+maintenance_service = MaintenanceService(open_store('maintenances', 'maintenances.json'))
+inventory_service = InventoryService(open_store('inventory', 'inventory.json'))
 
 # Flask Routes for Web-based Interface
+def read_json_body() -> Any:
+    """Decode the raw UTF-8 request body with orjson, bypassing request.json"""
+    try:
+        return orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError as e:
+        raise InvalidDataError(f"Request body is not valid JSON: {e}") from e
+
 @app.route('/')
 def index():
-    return jsonify({
+    return json_response({
         "message": "Welcome to the ERP System API",
         "available_routes": {
             "GET /assets": "Get all assets",
             "GET /assets/<uuid:asset_id>": "Get an asset by ID",
             "POST /assets": "Add a new asset",
+            "POST /assets/bulk": "Add a list of assets in one write",
             "GET /inventory": "Get all inventory items",
             "GET /inventory/<uuid:item_id>": "Get an inventory item by ID",
-            "POST /inventory": "Add a new inventory item"
+            "POST /inventory": "Add a new inventory item",
+            "POST /inventory/bulk": "Add a list of inventory items in one write"
         }
     })
 
 @app.route('/assets', methods=['GET'])
 @error_handler
 def get_assets():
-    asset_service = AssetService(FileHandler('assets.json'))
-    assets = asset_service.get_all_assets()
-    return jsonify([asset.to_dict() for asset in assets]), 200
+    return Response(asset_service.get_all_assets_json(), status=200, mimetype='application/json')
 
 @app.route('/assets/<uuid:asset_id>', methods=['GET'])
 @error_handler
 def get_asset(asset_id):
-    asset_service = AssetService(FileHandler('assets.json'))
     asset = asset_service.get_asset(asset_id)
     if not asset:
         abort(404, description="Asset not found")
-    return jsonify(asset.to_dict()), 200
+    return json_response(asset.to_dict(), 200)
 
 @app.route('/assets', methods=['POST'])
 @error_handler
 def add_asset():
-    data = request.json
+    # Body must be UTF-8 encoded JSON bytes; Content-Type is not inspected
+    data = read_json_body()
     asset = Asset.from_dict(data)
-    asset_service = AssetService(FileHandler('assets.json'))
-    asset_service.add_asset(asset)
-    return jsonify(asset.to_dict()), 201
+    # Encode the reply first so unencodable data is rejected before it is stored
+    body = encode_input_json(asset.to_dict())
+    # Service methods report rejected records as an error response
+    error = asset_service.add_asset(asset)
+    if error is not None:
+        return error
+    return Response(body, status=201, mimetype='application/json')
+
+@app.route('/assets/bulk', methods=['POST'])
+@error_handler
+def add_assets():
+    # Body must be a UTF-8 encoded JSON array of asset objects
+    data = read_json_body()
+    if not isinstance(data, list):
+        raise InvalidDataError("Expected a JSON array of assets")
+    assets = [Asset.from_dict(entry) for entry in data]
+    # Encode the reply first so unencodable data is rejected before it is stored
+    body = encode_input_json([asset.to_dict() for asset in assets])
+    # Service methods report rejected records as an error response
+    error = asset_service.add_assets(assets)
+    if error is not None:
+        return error
+    return Response(body, status=201, mimetype='application/json')
 
 @app.route('/inventory', methods=['GET'])
 @error_handler
 def get_inventory():
-    inventory_service = InventoryService(FileHandler('inventory.json'))
-    items = inventory_service.get_all_inventory_items()
-    return jsonify([item.to_dict() for item in items]), 200
+    return Response(inventory_service.get_all_inventory_items_json(), status=200, mimetype='application/json')
 
 @app.route('/inventory/<uuid:item_id>', methods=['GET'])
 @error_handler
 def get_inventory_item(item_id):
-    inventory_service = InventoryService(FileHandler('inventory.json'))
     item = inventory_service.get_inventory_item(item_id)
     if not item:
         abort(404, description="Inventory item not found")
-    return jsonify(item.to_dict()), 200
+    return json_response(item.to_dict(), 200)
 
 @app.route('/inventory', methods=['POST'])
 @error_handler
 def add_inventory_item():
-    data = request.json
+    # Body must be UTF-8 encoded JSON bytes; Content-Type is not inspected
+    data = read_json_body()
     item = InventoryItem.from_dict(data)
-    inventory_service = InventoryService(FileHandler('inventory.json'))
-    inventory_service.add_inventory_item(item)
-    return jsonify(item.to_dict()), 201
+    # Encode the reply first so unencodable data is rejected before it is stored
+    body = encode_input_json(item.to_dict())
+    # Service methods report rejected records as an error response
+    error = inventory_service.add_inventory_item(item)
+    if error is not None:
+        return error
+    return Response(body, status=201, mimetype='application/json')
+
+@app.route('/inventory/bulk', methods=['POST'])
+@error_handler
+def add_inventory_items():
+    # Body must be a UTF-8 encoded JSON array of inventory item objects
+    data = read_json_body()
+    if not isinstance(data, list):
+        raise InvalidDataError("Expected a JSON array of inventory items")
+    items = [InventoryItem.from_dict(entry) for entry in data]
+    # Encode the reply first so unencodable data is rejected before it is stored
+    body = encode_input_json([item.to_dict() for item in items])
+    # Service methods report rejected records as an error response
+    error = inventory_service.add_inventory_items(items)
+    if error is not None:
+        return error
+    return Response(body, status=201, mimetype='application/json')
 
 # Main execution
 def main():
-    asset_file_handler = FileHandler('assets.json')
-    maintenance_file_handler = FileHandler('maintenances.json')
-    inventory_file_handler = FileHandler('inventory.json')
-
-    asset_service = AssetService(asset_file_handler)
-    maintenance_service = MaintenanceService(maintenance_file_handler)
-    inventory_service = InventoryService(inventory_file_handler)
-
     # Example usage
     try:
         # Create an asset
@@ -478,17 +969,32 @@ def main():
         maintenance_service.add_maintenance(new_maintenance)
         logger.info(f"Added maintenance record for asset: {new_asset.name}")
 
-        # Add an inventory item
-        new_inventory_item = InventoryItem(
-            name="Spare Laptop Charger",
-            quantity=50,
-            cost_per_item=Decimal("25.00")
-        )
-        inventory_service.add_inventory_item(new_inventory_item)
-        logger.info(f"Added inventory item: {new_inventory_item.name}")
+        # Add inventory items in a single write
+        new_inventory_items = [
+            InventoryItem(
+                name="Spare Laptop Charger",
+                quantity=50,
+                cost_per_item=Decimal("25.00")
+            ),
+            InventoryItem(
+                name="USB-C Docking Station",
+                quantity=20,
+                cost_per_item=Decimal("120.00")
+            ),
+        ]
+        inventory_service.add_inventory_items(new_inventory_items)
+        logger.info(f"Added {len(new_inventory_items)} inventory items")
 
     except ERPError as e:
         logger.error(f"An error occurred: {str(e)}")
 
+# Production: serve `app` with a WSGI server, e.g.
+#     gunicorn -w 1 -k gthread --threads 8 main:app
+# Services keep their state in process memory, so extra worker processes
+# would each hold their own copy; scale with threads rather than workers.
 if __name__ == "__main__":
-    app.run(debug=True)  # Start the Flask application
+    if os.environ.get('ERP_DEV_SERVER') == '1':
+        app.run(debug=os.environ.get('FLASK_DEBUG') == '1')  # Local development only
+    else:
+        logger.error("Serve main:app with a WSGI server such as gunicorn, "
+                     "or set ERP_DEV_SERVER=1 to start the development server")